@@ -3,6 +3,7 @@ Django admin configuration for users app.
 """
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 from .models import (
     CustomUser, Team, TeamMembership, Task, TaskComment, TaskAttachment,
@@ -54,8 +55,10 @@ class TeamAdmin(admin.ModelAdmin):
     """
     list_display = ('name', 'leader', 'get_member_count', 'is_active', 'created_at')
     list_filter = ('is_active', 'created_at', 'leader')
+    list_select_related = ('leader',)
     search_fields = ('name', 'description', 'leader__email')
     readonly_fields = ('created_at', 'updated_at', 'get_member_count')
+    raw_id_fields = ('leader',)
     
     fieldsets = (
         (None, {'fields': ('name', 'description')}),
@@ -64,11 +67,19 @@ class TeamAdmin(admin.ModelAdmin):
         (_('Timestamps'), {'fields': ('created_at', 'updated_at')}),
     )
     
+    def get_queryset(self, request):
+        """Annotate member counts so the changelist avoids a COUNT per row."""
+        qs = super().get_queryset(request)
+        return qs.annotate(_member_count=Count('members'))
+
     def get_member_count(self, obj):
-        """Display the total member count."""
+        """Display the total member count (members + leader)."""
+        if hasattr(obj, '_member_count'):
+            return obj._member_count + 1
         return obj.get_member_count()
-    
+
     get_member_count.short_description = _('Members')
+    get_member_count.admin_order_field = '_member_count'
 
 
 class TeamMembershipInline(admin.TabularInline):
@@ -93,6 +104,7 @@ class TeamMembershipAdmin(admin.ModelAdmin):
     """
     list_display = ('get_team_name', 'get_member_name', 'get_member_email', 'date_joined')
     list_filter = ('team', 'date_joined')
+    list_select_related = ('team', 'member')
     search_fields = ('team__name', 'member__email', 'member__first_name', 'member__last_name')
     readonly_fields = ('date_joined',)
     
@@ -195,6 +207,7 @@ class TaskCommentAdmin(admin.ModelAdmin):
     """
     list_display = ('get_task_title', 'get_user_name', 'created_at')
     list_filter = ('created_at', 'task__team')
+    list_select_related = ('task', 'user')
     search_fields = ('task__title', 'user__email', 'comment')
     readonly_fields = ('created_at', 'updated_at', 'user', 'task')
     
@@ -233,6 +246,7 @@ class TaskAttachmentAdmin(admin.ModelAdmin):
     """
     list_display = ('filename', 'get_task_title', 'uploaded_by', 'uploaded_at')
     list_filter = ('uploaded_at', 'task__team')
+    list_select_related = ('task', 'uploaded_by')
     search_fields = ('file', 'task__title', 'uploaded_by__email')
     readonly_fields = ('uploaded_at', 'uploaded_by', 'task')
     
@@ -271,6 +285,7 @@ class NotificationAdmin(admin.ModelAdmin):
     """
     list_display = ('id', 'get_recipient_name', 'notification_type', 'is_read', 'created_at')
     list_filter = ('notification_type', 'is_read', 'created_at')
+    list_select_related = ('recipient', 'task')
     search_fields = ('recipient__email', 'message')
     readonly_fields = ('created_at', 'recipient', 'task', 'notification_type', 'message')
 
@@ -305,6 +320,7 @@ class TaskActivityAdmin(admin.ModelAdmin):
     """
     list_display = ('id', 'get_task_title', 'activity_type', 'get_user_name', 'created_at')
     list_filter = ('activity_type', 'created_at', 'task__team')
+    list_select_related = ('task', 'user')
     search_fields = ('task__title', 'user__email', 'description')
     readonly_fields = ('created_at', 'task', 'user', 'activity_type', 'description', 'old_value', 'new_value')
 
@@ -342,8 +358,10 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
     """
     list_display = ('get_user_name', 'email_notifications', 'created_at')
     list_filter = ('email_notifications', 'created_at')
+    list_select_related = ('user',)
     search_fields = ('user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('created_at', 'updated_at')
+    raw_id_fields = ('user',)
 
     fieldsets = (
         (_('User'), {
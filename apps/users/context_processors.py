@@ -1,6 +1,19 @@
 """
 Custom context processors for the users app.
 """
+from django.conf import settings
+
+_EMPTY_CONTEXT = {
+    'navbar_unread_notification_count': 0,
+    'navbar_recent_notifications': [],
+}
+
+_SKIP_PREFIXES = (
+    settings.STATIC_URL,
+    settings.MEDIA_URL,
+    '/admin/',
+    '/users/api/',
+)
 
 
 def notifications(request):
@@ -8,22 +21,38 @@ def notifications(request):
     Provide recent notifications and unread count for the navbar dropdown.
     Fails safe so a missing table or DB error never causes a 500.
     """
+    # Static/media/admin/API responses never render the navbar; skip the
+    # query (admin pages run context processors but use their own base
+    # template, and the JSON endpoints render no template at all).
+    if request.path.startswith(_SKIP_PREFIXES):
+        return _EMPTY_CONTEXT
     if not request.user.is_authenticated:
         return {
             'navbar_unread_notification_count': 0,
             'navbar_recent_notifications': [],
         }
     try:
+        from django.db.models import Count, Q, Window
+
         from .models import Notification
-        notifications_qs = Notification.objects.filter(recipient=request.user).select_related('task')
-        unread = notifications_qs.filter(is_read=False)
+
+        # Single query: the recent-10 slice carries the total unread count
+        # as a window aggregate, instead of a separate COUNT round-trip.
+        recent = list(
+            Notification.objects.filter(recipient=request.user)
+            .select_related('task__team')
+            .only('message', 'is_read', 'created_at', 'task__team__name')
+            .annotate(
+                _unread_total=Window(Count('id', filter=Q(is_read=False)))
+            )[:10]
+        )
+        unread_count = recent[0]._unread_total if recent else 0
         return {
-            'navbar_unread_notification_count': unread.count(),
-            'navbar_recent_notifications': list(notifications_qs[:10]),
+            'navbar_unread_notification_count': unread_count,
+            'navbar_recent_notifications': recent,
         }
     except Exception:
         return {
             'navbar_unread_notification_count': 0,
             'navbar_recent_notifications': [],
         }
-
@@ -6,6 +6,12 @@ from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
 
+# Allowed-role sets built once at import time; frozenset membership is a
+# constant-time hash lookup instead of a per-request list scan.
+TEAM_LEADER_ROLES = frozenset({'team_leader', 'admin'})
+TEAM_MEMBER_ROLES = frozenset({'team_member', 'team_leader', 'admin'})
+ADMIN_ROLE = 'admin'
+
 
 def team_leader_required(view_func):
     """
@@ -14,7 +20,7 @@ def team_leader_required(view_func):
     @wraps(view_func)
     @login_required
     def wrapper(request, *args, **kwargs):
-        if request.user.role not in ['team_leader', 'admin']:
+        if request.user.role not in TEAM_LEADER_ROLES:
             return HttpResponseForbidden(
                 'You do not have permission to access this page. Team leader access required.'
             )
@@ -29,7 +35,7 @@ def team_member_required(view_func):
     @wraps(view_func)
     @login_required
     def wrapper(request, *args, **kwargs):
-        if request.user.role not in ['team_member', 'team_leader', 'admin']:
+        if request.user.role not in TEAM_MEMBER_ROLES:
             return HttpResponseForbidden(
                 'You do not have permission to access this page. Team member access required.'
             )
@@ -44,7 +50,7 @@ def admin_required(view_func):
     @wraps(view_func)
     @login_required
     def wrapper(request, *args, **kwargs):
-        if request.user.role != 'admin':
+        if request.user.role != ADMIN_ROLE:
             return HttpResponseForbidden(
                 'You do not have permission to access this page. Admin access required.'
             )
@@ -3,9 +3,16 @@ Forms for user authentication and profile management.
 """
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm, PasswordResetForm
-from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.password_validation import (
+    get_default_password_validators,
+    validate_password,
+)
 from .models import CustomUser, Team, TeamMembership, Task, TaskComment, TaskAttachment
 
+# Instantiated once at import so each submit reuses the same validator
+# objects instead of rebuilding them from settings.
+PASSWORD_VALIDATORS = get_default_password_validators()
+
 
 class CustomUserCreationForm(UserCreationForm):
     """
@@ -71,7 +78,7 @@ class CustomUserCreationForm(UserCreationForm):
         """Validate password strength."""
         password = self.cleaned_data.get('password1')
         try:
-            validate_password(password)
+            validate_password(password, password_validators=PASSWORD_VALIDATORS)
         except forms.ValidationError as error:
             raise forms.ValidationError(error)
         return password
@@ -234,31 +241,46 @@ class AddTeamMemberForm(forms.Form):
     def __init__(self, team, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.team = team
-    
+        self._member_user = None
+
     def clean_member_email(self):
         """Validate that the user exists and isn't already a member."""
         email = self.cleaned_data.get('member_email')
-        
+
         try:
             user = CustomUser.objects.get(email__iexact=email)
         except CustomUser.DoesNotExist:
             raise forms.ValidationError('No user found with this email address.')
-        
+
         # Check if user is already a member
         if self.team.has_member(user):
             raise forms.ValidationError('This user is already a member of the team.')
-        
+
         # Cannot add team leader
         if user == self.team.leader:
             raise forms.ValidationError('The team leader is already a member.')
-        
+
+        # Cache the looked-up user so get_user() doesn't repeat the query
+        self._member_user = user
         return email
-    
+
     def get_user(self):
         """Return the user object after validation."""
         if not self.is_valid():
             return None
-        return CustomUser.objects.get(email__iexact=self.cleaned_data['member_email'])
+        return self._member_user
+
+
+def get_team_members_queryset(team):
+    """
+    Queryset of users who are members of the given team.
+
+    Restricted to the columns the assigned_to dropdowns render
+    (__str__ needs name and email), since this feeds form widgets only.
+    """
+    return CustomUser.objects.filter(
+        team_memberships__team=team
+    ).only('first_name', 'last_name', 'email').distinct()
 
 
 class TaskForm(forms.ModelForm):
@@ -298,12 +320,9 @@ class TaskForm(forms.ModelForm):
     def __init__(self, team, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.team = team
-        
+
         # Only show team members as options
-        team_members = CustomUser.objects.filter(
-            team_memberships__team=team
-        ).distinct()
-        self.fields['assigned_to'].queryset = team_members
+        self.fields['assigned_to'].queryset = get_team_members_queryset(team)
         self.fields['assigned_to'].label = 'Assign to'
         self.fields['assigned_to'].required = False
     
@@ -400,10 +419,7 @@ class TaskFilterForm(forms.Form):
     def __init__(self, team, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Set assignee choices to team members
-        team_members = CustomUser.objects.filter(
-            team_memberships__team=team
-        ).distinct()
-        self.fields['assigned_to'].queryset = team_members
+        self.fields['assigned_to'].queryset = get_team_members_queryset(team)
 
 
 class TaskStatusForm(forms.Form):
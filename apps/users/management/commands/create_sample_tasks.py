@@ -1,12 +1,15 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 from datetime import timedelta
-from apps.users.models import Team, Task, TaskComment, CustomUser, TeamMembership
+from apps.users.models import Tag, Team, Task, TaskComment, CustomUser, TeamMembership
 
 
 class Command(BaseCommand):
     help = 'Create sample tasks for testing task management features'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Creating sample tasks...'))
         
@@ -17,9 +20,12 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING('No admin user found. Skipping...'))
             return
 
-        # Get active teams
-        teams = Team.objects.filter(is_active=True)[:3]
-        
+        # Get active teams with leader and memberships preloaded so the
+        # per-team loop below does no additional queries
+        teams = Team.objects.filter(is_active=True).select_related('leader').prefetch_related(
+            Prefetch('members', queryset=TeamMembership.objects.select_related('member'))
+        )[:3]
+
         if not teams.exists():
             self.stdout.write(self.style.WARNING('No active teams found. Skipping...'))
             return
@@ -92,62 +98,90 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
-        
+        # Existing (title, team_id) pairs stand in for get_or_create checks
+        existing_tasks = set(
+            Task.objects.filter(team__in=teams).values_list('title', 'team_id')
+        )
+
+        pending_tasks = []
+
         for team in teams:
-            # Get team members (including leader)
-            team_members_list = list(team.members.values_list('member', flat=True))
-            team_members_list.append(team.leader.id)  # Include leader
-            
-            if not team_members_list:
-                self.stdout.write(self.style.WARNING(f'No members in team "{team.name}". Skipping...'))
-                continue
-            
-            assignees = list(CustomUser.objects.filter(id__in=team_members_list)[:5])
-            
+            # Team members (including leader), read from the prefetch cache
+            assignees = [m.member for m in team.members.all()][:4]
+            assignees.append(team.leader)
+
             if not assignees:
                 continue
-            
+
             # Create 2-3 tasks per team
             for i, task_data in enumerate(sample_tasks[:3]):
-                if i >= len(assignees):
-                    assigned_to = assignees[i % len(assignees)]
-                else:
-                    assigned_to = assignees[i]
-                
+                title = f"{task_data['title']} - {team.name}"
+                if (title, team.id) in existing_tasks:
+                    continue
+
+                assigned_to = assignees[i % len(assignees)]
                 due_date = timezone.now() + timedelta(days=task_data['due_days'])
-                
-                task, created = Task.objects.get_or_create(
-                    title=f"{task_data['title']} - {team.name}",
-                    team=team,
-                    defaults={
-                        'description': task_data['description'],
-                        'created_by': admin_user,
-                        'assigned_to': assigned_to,
-                        'priority': task_data['priority'],
-                        'status': task_data['status'],
-                        'due_date': due_date,
-                        'is_urgent': task_data['is_urgent'],
-                        'tags': 'sample,testing',
-                    }
-                )
-                
-                if created:
-                    created_count += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(f'✓ Created: {task.title}')
+
+                pending_tasks.append(
+                    Task(
+                        title=title,
+                        team=team,
+                        description=task_data['description'],
+                        created_by=admin_user,
+                        assigned_to=assigned_to,
+                        priority=task_data['priority'],
+                        status=task_data['status'],
+                        due_date=due_date,
+                        is_urgent=task_data['is_urgent'],
+                        tags='sample,testing',
                     )
-                    
-                    # Add sample comment
-                    if task_data['status'] in ['in_progress', 'review']:
-                        TaskComment.objects.get_or_create(
-                            task=task,
-                            user=assigned_to,
-                            defaults={
-                                'comment': 'Started working on this task. Making good progress!',
-                            }
-                        )
+                )
+
+        # One INSERT batch for tasks, then one for the sample comments
+        # (bulk_create populates PKs on SQLite 3.35+ and PostgreSQL)
+        created_tasks = Task.objects.bulk_create(pending_tasks, batch_size=500)
+
+        # bulk_create bypasses Task.save(), so mirror the CSV tags field
+        # into the Tag M2M here: one Tag get_or_create per distinct name,
+        # then one batch for the through rows
+        tag_names = sorted(
+            {name for task in created_tasks for name in task.get_tag_names()}
+        )
+        tags_by_name = {
+            name: Tag.objects.get_or_create(name=name)[0] for name in tag_names
+        }
+        through = Task.tag_items.through
+        through.objects.bulk_create(
+            [
+                through(task_id=task.id, tag_id=tags_by_name[name].id)
+                for task in created_tasks
+                for name in task.get_tag_names()
+            ],
+            batch_size=500,
+        )
+
+        TaskComment.objects.bulk_create(
+            [
+                TaskComment(
+                    task=task,
+                    user=task.assigned_to,
+                    comment='Started working on this task. Making good progress!',
+                )
+                for task in created_tasks
+                if task.status in ['in_progress', 'review']
+            ],
+            batch_size=500,
+        )
+
+        # One aggregated write + flush instead of a buffered line per task
+        if created_tasks:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    '\n'.join(f'✓ Created: {task.title}' for task in created_tasks)
+                )
+            )
+            self.stdout.flush()
 
         self.stdout.write(
-            self.style.SUCCESS(f'\n✓ Successfully created {created_count} sample tasks!')
+            self.style.SUCCESS(f'\n✓ Successfully created {len(created_tasks)} sample tasks!')
         )
@@ -4,12 +4,14 @@ Management command to create sample teams for testing.
 Usage: python manage.py create_sample_teams
 """
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from apps.users.models import CustomUser, Team, TeamMembership
 
 
 class Command(BaseCommand):
     help = 'Creates sample teams with members for testing'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         # Check if teams already exist
         if Team.objects.exists():
@@ -20,8 +22,8 @@ class Command(BaseCommand):
         leader1 = CustomUser.objects.get(email='leader1@example.com')
         leader2 = CustomUser.objects.get(email='leader2@example.com')
         
-        # Get team members
-        members = CustomUser.objects.filter(email__startswith='member')
+        # Get team members (materialized once; slices below reuse the list)
+        members = list(CustomUser.objects.filter(email__startswith='member'))
 
         # Create Team 1
         team1 = Team.objects.create(
@@ -32,9 +34,11 @@ class Command(BaseCommand):
         )
         self.stdout.write(self.style.SUCCESS(f'Created team: {team1.name}'))
 
-        # Add members to Team 1
+        # Add members to Team 1 (one INSERT batch instead of one per member)
+        TeamMembership.objects.bulk_create(
+            [TeamMembership(team=team1, member=member) for member in members[:3]]
+        )
         for member in members[:3]:
-            TeamMembership.objects.create(team=team1, member=member)
             self.stdout.write(f'  → Added {member.get_display_name()}')
 
         # Create Team 2
@@ -46,9 +50,11 @@ class Command(BaseCommand):
         )
         self.stdout.write(self.style.SUCCESS(f'Created team: {team2.name}'))
 
-        # Add members to Team 2
+        # Add members to Team 2 (one INSERT batch instead of one per member)
+        TeamMembership.objects.bulk_create(
+            [TeamMembership(team=team2, member=member) for member in members[2:]]
+        )
         for member in members[2:]:
-            TeamMembership.objects.create(team=team2, member=member)
             self.stdout.write(f'  → Added {member.get_display_name()}')
 
         self.stdout.write(
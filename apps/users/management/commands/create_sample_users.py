@@ -4,7 +4,11 @@ Management command to create sample users for testing.
 Usage: python manage.py create_sample_users
 """
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from apps.users.models import NotificationPreference
 
 User = get_user_model()
 
@@ -12,51 +16,70 @@ User = get_user_model()
 class Command(BaseCommand):
     help = 'Creates sample users with different roles for testing'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         # Check if users already exist
         if User.objects.exists():
             self.stdout.write(self.style.WARNING('Users already exist. Skipping creation.'))
             return
 
-        # Create admin user
-        admin_user = User.objects.create_superuser(
-            username='admin@example.com',
-            email='admin@example.com',
-            password='admin123456',
-            first_name='Admin',
-            last_name='User',
-            role='admin'
-        )
-        self.stdout.write(
-            self.style.SUCCESS(f'Created admin user: {admin_user.email}')
-        )
+        # Hash each shared password exactly once; PBKDF2 dominates per-user cost
+        hashed = {
+            prefix: make_password(f'{prefix}123456')
+            for prefix in ('admin', 'leader', 'member')
+        }
 
-        # Create team leader users
-        for i in range(2):
-            leader = User.objects.create_user(
+        users = [
+            User(
+                username='admin@example.com',
+                email='admin@example.com',
+                password=hashed['admin'],
+                first_name='Admin',
+                last_name='User',
+                role='admin',
+                is_staff=True,
+                is_superuser=True,
+            )
+        ] + [
+            User(
                 username=f'leader{i+1}@example.com',
                 email=f'leader{i+1}@example.com',
-                password='leader123456',
-                first_name=f'Leader',
+                password=hashed['leader'],
+                first_name='Leader',
                 last_name=f'User {i+1}',
                 role='team_leader'
             )
-            self.stdout.write(
-                self.style.SUCCESS(f'Created team leader: {leader.email}')
-            )
-
-        # Create team member users
-        for i in range(5):
-            member = User.objects.create_user(
+            for i in range(2)
+        ] + [
+            User(
                 username=f'member{i+1}@example.com',
                 email=f'member{i+1}@example.com',
-                password='member123456',
-                first_name=f'Team',
+                password=hashed['member'],
+                first_name='Team',
                 last_name=f'Member {i+1}',
                 role='team_member'
             )
+            for i in range(5)
+        ]
+
+        # One INSERT batch for every sample user, admin included
+        User.objects.bulk_create(users)
+
+        # bulk_create doesn't fire post_save, so create the notification
+        # preferences explicitly — also as a single batch
+        NotificationPreference.objects.bulk_create(
+            [NotificationPreference(user=user) for user in users],
+            ignore_conflicts=True,
+        )
+
+        labels = {
+            'admin': 'admin user',
+            'team_leader': 'team leader',
+            'team_member': 'team member',
+        }
+        for user in users:
             self.stdout.write(
-                self.style.SUCCESS(f'Created team member: {member.email}')
+                self.style.SUCCESS(f'Created {labels[user.role]}: {user.email}')
             )
 
         self.stdout.write(
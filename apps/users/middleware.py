@@ -1,21 +1,23 @@
 """
 Middleware for role-based access control.
 """
-from django.http import HttpResponseForbidden
+from django.utils.functional import SimpleLazyObject
 
 
 class RoleCheckMiddleware:
     """
     Middleware to log and track role-based access attempts.
     """
-    
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        # Log role information if user is authenticated
-        if request.user.is_authenticated:
-            request.user_role = request.user.role
-        
+        # Lazy so the user row is only fetched if something reads user_role;
+        # touching request.user here would force a DB hit on every request.
+        request.user_role = SimpleLazyObject(
+            lambda: getattr(request.user, 'role', None)
+        )
+
         response = self.get_response(request)
         return response
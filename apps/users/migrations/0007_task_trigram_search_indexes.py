@@ -0,0 +1,41 @@
+"""
+PostgreSQL-only trigram indexes for task search.
+
+The task list and global search filter with icontains on title and
+description. On PostgreSQL, pg_trgm GIN indexes let the planner serve
+those ILIKE '%term%' scans from an index; SQLite development databases
+are left untouched.
+"""
+from django.db import migrations
+
+
+def add_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS task_title_trgm_idx '
+        'ON users_task USING gin (title gin_trgm_ops);'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS task_description_trgm_idx '
+        'ON users_task USING gin (description gin_trgm_ops);'
+    )
+
+
+def remove_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS task_title_trgm_idx;')
+    schema_editor.execute('DROP INDEX IF EXISTS task_description_trgm_idx;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_customuser_users_email_lower_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigram_indexes, remove_trigram_indexes),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-31 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_task_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Tag name', max_length=50, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Tag',
+                'verbose_name_plural': 'Tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='tag_items',
+            field=models.ManyToManyField(blank=True, help_text='Normalized tags parsed from the tags field', related_name='tasks', to='users.tag'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+"""
+Backfill the normalized Tag M2M from the existing comma-separated
+Task.tags values.
+"""
+from django.db import migrations
+
+
+def backfill_tags(apps, schema_editor):
+    Tag = apps.get_model('users', 'Tag')
+    Task = apps.get_model('users', 'Task')
+
+    for task in Task.objects.exclude(tags='').only('id', 'tags').iterator(chunk_size=500):
+        names = [tag.strip() for tag in task.tags.split(',') if tag.strip()]
+        tags = [Tag.objects.get_or_create(name=name)[0] for name in names]
+        task.tag_items.set(tags)
+
+
+def clear_tags(apps, schema_editor):
+    Tag = apps.get_model('users', 'Tag')
+    Tag.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_tag_task_tag_items'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tags, clear_tags),
+    ]
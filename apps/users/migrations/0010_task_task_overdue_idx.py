@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 06:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_backfill_task_tag_items'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'completed'), _negated=True), fields=['due_date'], name='task_overdue_idx'),
+        ),
+    ]
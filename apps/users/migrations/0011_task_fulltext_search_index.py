@@ -0,0 +1,37 @@
+"""
+Full-text search index for task title/description search.
+
+On PostgreSQL, a GIN index over the combined tsvector of title and
+description lets TaskQuerySet.search_text run as an index lookup instead
+of a sequential scan. SQLite (used in development) has no equivalent and
+keeps the icontains fallback, so the DDL only runs on PostgreSQL.
+"""
+from django.db import migrations
+
+
+def create_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS task_search_vector_idx "
+        "ON users_task USING gin ("
+        "(to_tsvector('english', COALESCE(title, '')) || "
+        "to_tsvector('english', COALESCE(description, ''))));"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS task_search_vector_idx;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_task_task_overdue_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.17 on 2026-08-31 07:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_task_fulltext_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='users_task_team_id_d76530_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='users_task_assigne_409c22_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='teammembership',
+            name='users_teamm_team_id_2eaec8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='teammembership',
+            name='users_teamm_team_id_fbaa06_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['team', 'status', 'updated_at'], name='users_task_team_id_2fbb38_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assigned_to', 'status', 'updated_at'], name='users_task_assigne_1fddf3_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.17 on 2026-08-31 07:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """Seed counters from completions already in the task table."""
+    Task = apps.get_model('users', 'Task')
+    DailyTaskStat = apps.get_model('users', 'DailyTaskStat')
+
+    rows = (
+        Task.objects.filter(status='completed')
+        .annotate(day=TruncDate('updated_at'))
+        .values('assigned_to', 'team', 'day')
+        .annotate(count=Count('id'))
+    )
+    DailyTaskStat.objects.bulk_create(
+        [
+            DailyTaskStat(
+                user_id=row['assigned_to'],
+                team_id=row['team'],
+                day=row['day'],
+                completed_count=row['count'],
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+def clear_daily_stats(apps, schema_editor):
+    apps.get_model('users', 'DailyTaskStat').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_task_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTaskStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('completed_count', models.PositiveIntegerField(default=0)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_task_stats', to='users.team')),
+                ('user', models.ForeignKey(blank=True, help_text='Assignee at completion time; null for unassigned tasks', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_task_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Daily Task Stat',
+                'verbose_name_plural': 'Daily Task Stats',
+                'ordering': ['day'],
+                'indexes': [models.Index(fields=['team', 'day'], name='users_daily_team_id_6dedb4_idx'), models.Index(fields=['user', 'day'], name='users_daily_user_id_bb74a2_idx')],
+                'unique_together': {('user', 'team', 'day')},
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, clear_daily_stats),
+    ]
@@ -1,7 +1,8 @@
 """
 Custom User model for team collaboration with role-based access.
 """
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 
@@ -49,6 +50,7 @@ class CustomUser(AbstractUser):
         ordering = ['-date_joined']
         indexes = [
             models.Index(fields=['email']),
+            models.Index(Lower('email'), name='users_email_lower_idx'),
             models.Index(fields=['role']),
         ]
     
@@ -69,15 +71,43 @@ class CustomUser(AbstractUser):
     
     def get_display_name(self):
         """Get user's display name (full name or username)."""
-        if self.get_full_name():
-            return self.get_full_name()
-        return self.username
+        # Cached per instance: called repeatedly from __str__ methods and
+        # templates while rendering lists. __dict__ access skips the field
+        # descriptors and never collides with a model field.
+        display_name = self.__dict__.get('_display_name')
+        if display_name is None:
+            display_name = self.get_full_name() or self.username
+            self.__dict__['_display_name'] = display_name
+        return display_name
+
+
+class TeamQuerySet(models.QuerySet):
+    """Queryset helpers for Team."""
+
+    def with_member_counts(self):
+        """Annotate each team with its membership count in one query."""
+        return self.annotate(_member_count=models.Count('members', distinct=True))
+
+    def accessible_to(self, user):
+        """
+        Teams the user leads or belongs to, in a single query.
+
+        The membership leg uses an IN-subquery on TeamMembership rather
+        than an OR across a LEFT JOIN, which needs no DISTINCT and lets
+        the planner serve each leg from its own index.
+        """
+        return self.filter(
+            models.Q(leader=user)
+            | models.Q(
+                id__in=TeamMembership.objects.filter(member=user).values('team_id')
+            )
+        )
 
 
 class Team(models.Model):
     """
     Team model for managing group collaboration.
-    
+
     A team is led by a team_leader and contains multiple members.
     """
     name = models.CharField(
@@ -102,7 +132,9 @@ class Team(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = TeamQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Team')
         verbose_name_plural = _('Teams')
@@ -118,15 +150,23 @@ class Team(models.Model):
     
     def get_member_count(self):
         """Get the total number of members including the leader."""
-        return self.members.count() + 1
+        count = getattr(self, '_member_count', None)
+        if count is None:
+            count = self.members.count()
+        return count + 1
     
     def has_member(self, user):
         """Check if a user is a member of this team."""
-        return self.members.filter(member=user).exists() or self.leader == user
+        # Compare leader_id first: it's free (no query), while the
+        # membership check costs one EXISTS.
+        if self.leader_id == user.pk:
+            return True
+        return self.members.filter(member_id=user.pk).exists()
     
     def is_leader(self, user):
         """Check if a user is the leader of this team."""
-        return self.leader == user
+        # FK id comparison; self.leader would lazily fetch the User row
+        return self.leader_id == user.pk
 
 
 class TeamMembership(models.Model):
@@ -157,19 +197,102 @@ class TeamMembership(models.Model):
         verbose_name_plural = _('Team Memberships')
         unique_together = ('team', 'member')
         ordering = ['-date_joined']
-        indexes = [
-            models.Index(fields=['team', 'member']),
-            models.Index(fields=['team']),
-        ]
+        # No extra indexes: the unique (team, member) constraint index
+        # serves both the pair lookup and team-prefix scans, and the FK
+        # columns carry their own automatic indexes
     
     def __str__(self):
         return f"{self.member.get_display_name()} → {self.team.name}"
 
 
+class Tag(models.Model):
+    """
+    Normalized tag for indexed task filtering.
+
+    Rows are created on demand from the comma-separated Task.tags field.
+    """
+    name = models.CharField(
+        max_length=50,
+        unique=True,
+        help_text=_('Tag name')
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Tag')
+        verbose_name_plural = _('Tags')
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class TaskQuerySet(models.QuerySet):
+    """Queryset helpers for Task."""
+
+    def with_related(self):
+        """Eagerly join the FK rows rendered alongside every task."""
+        return self.select_related('team', 'assigned_to', 'created_by')
+
+    def for_listing(self):
+        """
+        Restrict rows to the columns the list/dashboard templates render.
+
+        Leaves out ``description`` (potentially long TEXT), which dominates
+        the bytes hydrated per row but is only shown on the detail page.
+        """
+        return self.with_related().only(
+            'id', 'title', 'status', 'priority', 'due_date', 'is_urgent',
+            'created_at', 'updated_at',
+            'team__id', 'team__name',
+            'assigned_to__id', 'assigned_to__username',
+            'assigned_to__first_name', 'assigned_to__last_name',
+            'created_by__id', 'created_by__username',
+            'created_by__first_name', 'created_by__last_name',
+        )
+
+    def overdue(self):
+        """Open tasks whose due date has passed."""
+        from django.utils import timezone
+        return self.filter(due_date__lt=timezone.now()).exclude(status='completed')
+
+    def search_text(self, text):
+        """
+        Match tasks whose title or description contains ``text``.
+
+        On PostgreSQL this uses full-text search (served by the GIN
+        expression index from migration 0011) instead of the seq-scanning
+        icontains OR-filter, parsing the query websearch-style ("quoted
+        phrases", -exclusions) and annotating ``search_rank`` so callers
+        can order best matches first. SQLite development databases keep
+        the portable icontains path with a constant rank.
+        """
+        if connections[self.db or DEFAULT_DB_ALIAS].vendor == 'postgresql':
+            from django.contrib.postgres.search import (
+                SearchQuery,
+                SearchRank,
+                SearchVector,
+            )
+
+            vector = (
+                SearchVector('title', config='english')
+                + SearchVector('description', config='english')
+            )
+            query = SearchQuery(text, config='english', search_type='websearch')
+            return self.annotate(
+                search=vector, search_rank=SearchRank(vector, query)
+            ).filter(search=query)
+        return self.filter(
+            models.Q(title__icontains=text) | models.Q(description__icontains=text)
+        ).annotate(
+            search_rank=models.Value(0.0, output_field=models.FloatField())
+        )
+
+
 class Task(models.Model):
     """
     Task model for team collaboration and project management.
-    
+
     Tracks tasks within teams with priority, status, assignment, and deadlines.
     """
     
@@ -186,7 +309,10 @@ class Task(models.Model):
         ('review', _('Review')),
         ('completed', _('Completed')),
     ]
-    
+
+    # Statuses counted as "active" work (home page counter, signals)
+    ACTIVE_STATUSES = ('not_started', 'in_progress', 'review')
+
     title = models.CharField(
         max_length=200,
         help_text=_('Task title or name')
@@ -237,42 +363,92 @@ class Task(models.Model):
         blank=True,
         help_text=_('Comma-separated tags for organization')
     )
+    tag_items = models.ManyToManyField(
+        Tag,
+        blank=True,
+        related_name='tasks',
+        help_text=_('Normalized tags parsed from the tags field')
+    )
     is_urgent = models.BooleanField(
         default=False,
         help_text=_('Mark task as urgent/flagged')
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Task')
         verbose_name_plural = _('Tasks')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['team', 'status']),
-            models.Index(fields=['assigned_to', 'status']),
+            # updated_at as trailing column serves the filter+sort shape
+            # the dashboards and analytics use (status filter ordered or
+            # ranged by recency); the two-column lookups use the prefix
+            models.Index(fields=['team', 'status', 'updated_at']),
+            models.Index(fields=['assigned_to', 'status', 'updated_at']),
             models.Index(fields=['due_date']),
+            models.Index(
+                fields=['due_date'],
+                condition=~models.Q(status='completed'),
+                name='task_overdue_idx',
+            ),
             models.Index(fields=['priority']),
             models.Index(fields=['team', 'created_at']),
         ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Loaded CSV value, read without triggering deferred-field queries,
+        # so save() only re-syncs tag_items when tags actually changed.
+        self._loaded_tags = self.__dict__.get('tags')
+        # Loaded status/assignee, so post_save signals can detect
+        # transitions (completion counters, per-user active-task counters)
+        self._loaded_status = self.__dict__.get('status')
+        self._loaded_assigned_to_id = self.__dict__.get('assigned_to_id')
+
+    def save(self, *args, **kwargs):
+        # On the first save _loaded_tags holds whatever __init__ kwargs
+        # set (e.g. Task.objects.create(tags='a,b')), not a loaded DB
+        # value, so the changed-tags comparison alone would skip the sync
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if (adding and self.__dict__.get('tags')) or (
+            self.__dict__.get('tags') != self._loaded_tags
+        ):
+            self.sync_tag_items()
+            self._loaded_tags = self.tags
+        self._loaded_status = self.__dict__.get('status')
+        self._loaded_assigned_to_id = self.__dict__.get('assigned_to_id')
+
+    def get_tag_names(self):
+        """Split the comma-separated tags field into a clean list."""
+        return [tag.strip() for tag in (self.tags or '').split(',') if tag.strip()]
+
+    def sync_tag_items(self):
+        """Mirror the CSV tags field into the normalized Tag M2M."""
+        tags = [Tag.objects.get_or_create(name=name)[0] for name in self.get_tag_names()]
+        self.tag_items.set(tags)
+
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
-    
+
     def is_overdue(self):
         """Check if task is overdue."""
         from django.utils import timezone
         return self.due_date and self.due_date < timezone.now() and self.status != 'completed'
     
+    PRIORITY_COLORS = {
+        'low': 'success',
+        'medium': 'warning',
+        'high': 'danger',
+        'critical': 'dark',
+    }
+
     def get_priority_color(self):
         """Get color for priority badge."""
-        color_map = {
-            'low': 'success',
-            'medium': 'warning',
-            'high': 'danger',
-            'critical': 'dark',
-        }
-        return color_map.get(self.priority, 'secondary')
+        return self.PRIORITY_COLORS.get(self.priority, 'secondary')
 
 
 class TaskComment(models.Model):
@@ -400,6 +576,15 @@ class Notification(models.Model):
         indexes = [
             models.Index(fields=['recipient', 'is_read']),
             models.Index(fields=['recipient', 'created_at']),
+            models.Index(
+                fields=['recipient', 'is_read', 'created_at'],
+                name='notif_recip_read_created_idx',
+            ),
+            models.Index(
+                fields=['recipient'],
+                condition=models.Q(is_read=False),
+                name='notif_recip_unread_idx',
+            ),
             models.Index(fields=['task']),
         ]
 
@@ -515,3 +700,41 @@ class NotificationPreference(models.Model):
 
     def __str__(self):
         return f"Notification preferences for {self.user.get_display_name()}"
+
+
+class DailyTaskStat(models.Model):
+    """
+    Pre-aggregated completed-task counts per assignee, team, and day.
+
+    Maintained by the Task post_save signal on transitions into
+    'completed', so dashboard completion trends read a handful of
+    counter rows instead of re-grouping the task table on every load.
+    """
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='daily_task_stats',
+        null=True,
+        blank=True,
+        help_text=_('Assignee at completion time; null for unassigned tasks')
+    )
+    team = models.ForeignKey(
+        Team,
+        on_delete=models.CASCADE,
+        related_name='daily_task_stats'
+    )
+    day = models.DateField()
+    completed_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = _('Daily Task Stat')
+        verbose_name_plural = _('Daily Task Stats')
+        unique_together = ('user', 'team', 'day')
+        ordering = ['day']
+        indexes = [
+            models.Index(fields=['team', 'day']),
+            models.Index(fields=['user', 'day']),
+        ]
+
+    def __str__(self):
+        return f"{self.team.name} on {self.day}: {self.completed_count} completed"
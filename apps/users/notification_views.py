@@ -1,29 +1,61 @@
 """
 Views for in-app notification listing and mark-as-read actions.
 """
+from datetime import datetime
+
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
+from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect, render
 
 from .models import Notification
 
+NOTIFICATIONS_PER_PAGE = 20
+
 
 @login_required
 def notification_list(request):
     """
     Display notifications for the current user.
+
+    Uses keyset pagination (?before=<iso>&before_id=<id>) instead of
+    Paginator so no COUNT(*) runs per page and deep pages stay index seeks.
     """
     notifications_qs = Notification.objects.filter(
         recipient=request.user
-    ).select_related('task')
+    ).select_related('task').only(
+        'message', 'notification_type', 'is_read', 'created_at', 'task__title'
+    )
+
+    before = request.GET.get('before')
+    before_id = request.GET.get('before_id')
+    if before:
+        try:
+            cursor_dt = datetime.fromisoformat(before)
+            cursor_id = int(before_id or 0)
+            notifications_qs = notifications_qs.filter(
+                Q(created_at__lt=cursor_dt)
+                | Q(created_at=cursor_dt, id__lt=cursor_id)
+            )
+        except (ValueError, TypeError):
+            pass  # Malformed cursor: fall back to the first page
+
+    rows = list(
+        notifications_qs.order_by('-created_at', '-id')[:NOTIFICATIONS_PER_PAGE + 1]
+    )
+    has_more = len(rows) > NOTIFICATIONS_PER_PAGE
+    notifications = rows[:NOTIFICATIONS_PER_PAGE]
 
-    paginator = Paginator(notifications_qs, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    next_before = next_before_id = None
+    if has_more:
+        last = notifications[-1]
+        next_before = last.created_at.isoformat()
+        next_before_id = last.id
 
     context = {
-        'page_obj': page_obj,
+        'notifications': notifications,
+        'next_before': next_before,
+        'next_before_id': next_before_id,
     }
     return render(request, 'notifications/notification_list.html', context)
 
@@ -33,7 +65,9 @@ def mark_notification_read(request, pk):
     """
     Mark a single notification as read and optionally redirect to related task.
     """
-    notification = get_object_or_404(Notification, pk=pk, recipient=request.user)
+    notification = get_object_or_404(
+        Notification.objects.select_related('task'), pk=pk, recipient=request.user
+    )
     notification.is_read = True
     notification.save(update_fields=['is_read'])
 
@@ -50,7 +84,10 @@ def mark_all_notifications_read(request):
     """
     Mark all notifications for the current user as read.
     """
-    Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
-    messages.success(request, 'All notifications marked as read.')
+    updated = Notification.objects.filter(
+        recipient=request.user, is_read=False
+    ).update(is_read=True)
+    if updated:
+        messages.success(request, 'All notifications marked as read.')
     return redirect('users:notification_list')
 
@@ -1,29 +1,174 @@
 """
 Signals for the users app.
 
-Auto-create notification preferences when user is created.
+Auto-create notification preferences when user is created, and keep the
+cached home page statistics from serving stale counts after writes.
 """
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import CustomUser, NotificationPreference
+from django.utils import timezone
 
+from .models import (
+    CustomUser,
+    DailyTaskStat,
+    NotificationPreference,
+    Task,
+    Team,
+    TeamMembership,
+)
+from .views import home_active_tasks_key, home_team_count_key
 
-@receiver(post_save, sender=CustomUser)
+
+def _adjust_counter(key, delta):
+    """
+    Apply a delta to a cached counter, ignoring missing keys.
+
+    A missing key means the counter expired or was never computed; the
+    next home page load recomputes it from the database, so skipping the
+    adjustment is safe.
+    """
+    if not delta:
+        return
+    try:
+        if delta > 0:
+            cache.incr(key, delta)
+        else:
+            cache.decr(key, -delta)
+    except ValueError:
+        pass
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid='users.create_notification_preference')
 def create_notification_preference(sender, instance, created, **kwargs):
     """
     Create NotificationPreference instance when CustomUser is created.
+
+    dispatch_uid prevents duplicate registration under autoreload, and a
+    plain create() skips the SELECT half of get_or_create since the user
+    row is known to be new.
     """
     if created:
         try:
-            NotificationPreference.objects.get_or_create(user=instance)
+            NotificationPreference.objects.create(user=instance)
         except Exception:
             pass  # Table may not exist yet (migrations pending)
 
 
-@receiver(post_save, sender=CustomUser)
-def save_notification_preference(sender, instance, **kwargs):
+@receiver(
+    post_save,
+    sender=Task,
+    dispatch_uid='users.adjust_active_task_counter',
+)
+def adjust_active_task_counter(sender, instance, created, **kwargs):
+    """
+    Keep per-user active-task counters in step with task writes.
+
+    The home page reads these counters instead of counting tasks, so the
+    write path adjusts them on status transitions in or out of the
+    active set and on reassignment.
+    """
+    previous_assignee = (
+        None if created else getattr(instance, '_loaded_assigned_to_id', None)
+    )
+    previous_status = (
+        None if created else getattr(instance, '_loaded_status', None)
+    )
+    was_active = previous_assignee and previous_status in Task.ACTIVE_STATUSES
+    is_active = instance.assigned_to_id and instance.status in Task.ACTIVE_STATUSES
+
+    if previous_assignee == instance.assigned_to_id:
+        if is_active and not was_active:
+            _adjust_counter(home_active_tasks_key(instance.assigned_to_id), 1)
+        elif was_active and not is_active:
+            _adjust_counter(home_active_tasks_key(instance.assigned_to_id), -1)
+    else:
+        if was_active:
+            _adjust_counter(home_active_tasks_key(previous_assignee), -1)
+        if is_active:
+            _adjust_counter(home_active_tasks_key(instance.assigned_to_id), 1)
+
+
+@receiver(
+    post_delete,
+    sender=Task,
+    dispatch_uid='users.drop_active_task_counter',
+)
+def drop_active_task_counter(sender, instance, **kwargs):
+    """
+    Decrement the assignee's active-task counter when a task is deleted.
+    """
+    if instance.assigned_to_id and instance.status in Task.ACTIVE_STATUSES:
+        _adjust_counter(home_active_tasks_key(instance.assigned_to_id), -1)
+
+
+@receiver(
+    post_save,
+    sender=Task,
+    dispatch_uid='users.record_daily_completion',
+)
+def record_daily_completion(sender, instance, created, **kwargs):
+    """
+    Bump the DailyTaskStat counter when a task transitions to completed.
+
+    The counter table is what the dashboards read their completion
+    trends from, so it must grow in lockstep with completions.
+    """
+    previous = None if created else getattr(instance, '_loaded_status', None)
+    if instance.status != 'completed' or previous == 'completed':
+        return
+
+    day = timezone.localdate(instance.updated_at or timezone.now())
+    stat, created_row = DailyTaskStat.objects.get_or_create(
+        user_id=instance.assigned_to_id,
+        team_id=instance.team_id,
+        day=day,
+        defaults={'completed_count': 1},
+    )
+    if not created_row:
+        # F() keeps the increment atomic under concurrent completions
+        DailyTaskStat.objects.filter(pk=stat.pk).update(
+            completed_count=F('completed_count') + 1
+        )
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Team,
+    dispatch_uid='users.reset_leader_team_counter',
+)
+def reset_leader_team_counter(sender, instance, **kwargs):
+    """
+    Drop the leader's cached team counter when one of their teams changes.
+
+    Creating, deleting, and is_active flips all shift the count, and the
+    previous active state is unknown here, so invalidation (recompute on
+    the next home load) is the safe adjustment rather than incr/decr.
+    """
+    cache.delete(home_team_count_key(instance.leader_id))
+
+
+@receiver(
+    post_save,
+    sender=TeamMembership,
+    dispatch_uid='users.bump_team_counter',
+)
+def bump_team_counter(sender, instance, created, **kwargs):
+    """
+    Increment the member's team counter when they join a team.
+    """
+    if created:
+        _adjust_counter(home_team_count_key(instance.member_id), 1)
+
+
+@receiver(
+    post_delete,
+    sender=TeamMembership,
+    dispatch_uid='users.drop_team_counter',
+)
+def drop_team_counter(sender, instance, **kwargs):
     """
-    Save NotificationPreference instance when CustomUser is saved.
+    Decrement the member's team counter when they leave a team.
     """
-    if hasattr(instance, 'notification_preferences'):
-        instance.notification_preferences.save()
+    _adjust_counter(home_team_count_key(instance.member_id), -1)
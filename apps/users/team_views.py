@@ -6,14 +6,16 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
 from django.db.models import Q
-from .models import Team, TeamMembership, CustomUser
+from .models import Team, TeamMembership
 from .forms import TeamForm, AddTeamMemberForm
 from .decorators import team_leader_required
 
 
 def is_team_leader_or_admin(user, team):
     """Check if user is the team leader or an admin."""
-    return team.leader == user or user.is_admin()
+    # Compare the FK id directly: team.leader would fetch the leader row
+    # when the team was loaded without select_related('leader')
+    return team.leader_id == user.id or user.is_admin()
 
 
 @login_required
@@ -31,9 +33,7 @@ def team_list(request):
         teams = Team.objects.all()
     elif user.is_team_leader():
         # Show teams led by this user and teams they're members of
-        teams = Team.objects.filter(
-            Q(leader=user) | Q(members__member=user)
-        ).distinct()
+        teams = Team.objects.accessible_to(user)
     else:
         # Team members see only teams they belong to
         teams = Team.objects.filter(members__member=user)
@@ -49,7 +49,10 @@ def team_list(request):
     # Filter active teams
     if not user.is_admin():
         teams = teams.filter(is_active=True)
-    
+
+    # One aggregate query for the member counts shown per card
+    teams = teams.with_member_counts()
+
     context = {
         'teams': teams,
         'search_query': search_query,
@@ -90,15 +93,22 @@ def team_detail(request, pk):
     Display team details and member list.
     Accessible to team members, team leaders, and admins.
     """
-    team = get_object_or_404(Team, pk=pk)
-    
-    # Check if user has access to this team
-    if not team.has_member(request.user) and not request.user.is_admin():
+    # The leader row is rendered in the header, so join it up front
+    team = get_object_or_404(Team.objects.select_related('leader'), pk=pk)
+
+    # Check if user has access to this team; the in-memory admin test
+    # runs before the membership EXISTS query
+    if not (request.user.is_admin() or team.has_member(request.user)):
         messages.error(request, 'You do not have access to this team.')
         return redirect('users:team_list')
-    
-    # Get all members (including the leader)
-    members = team.members.select_related('member').all()
+
+    # Get all members (including the leader), restricted to the columns
+    # the member cards render
+    members = team.members.select_related('member').only(
+        'date_joined', 'team_id',
+        'member__username', 'member__first_name', 'member__last_name',
+        'member__email', 'member__profile_picture',
+    )
     
     context = {
         'team': team,
@@ -172,13 +182,13 @@ def manage_members(request, pk):
     Manage team members (add/remove members).
     Only team leader or admin can access.
     """
-    team = get_object_or_404(Team, pk=pk)
-    
+    team = get_object_or_404(Team.objects.select_related('leader'), pk=pk)
+
     # Permission check
     if not is_team_leader_or_admin(request.user, team):
         messages.error(request, 'You do not have permission to manage this team.')
         return redirect('users:team_detail', pk=team.pk)
-    
+
     if request.method == 'POST':
         form = AddTeamMemberForm(team, request.POST)
         if form.is_valid():
@@ -197,8 +207,12 @@ def manage_members(request, pk):
     else:
         form = AddTeamMemberForm(team)
     
-    members = team.members.select_related('member').all()
-    
+    members = team.members.select_related('member').only(
+        'date_joined', 'team_id',
+        'member__username', 'member__first_name', 'member__last_name',
+        'member__email', 'member__profile_picture',
+    )
+
     context = {
         'team': team,
         'form': form,
@@ -214,22 +228,30 @@ def remove_member(request, pk, user_id):
     Remove a member from the team (team leader only).
     """
     team = get_object_or_404(Team, pk=pk)
-    user = get_object_or_404(CustomUser, pk=user_id)
-    
+
     # Permission check
     if not is_team_leader_or_admin(request.user, team):
         messages.error(request, 'You do not have permission to manage this team.')
         return redirect('users:team_detail', pk=team.pk)
-    
-    # Cannot remove team leader
-    if user == team.leader:
+
+    # Cannot remove team leader (id check, no user fetch needed)
+    if str(team.leader_id) == str(user_id):
         messages.error(request, 'You cannot remove the team leader.')
         return redirect('users:manage_members', pk=team.pk)
-    
-    # Remove the member
-    TeamMembership.objects.filter(team=team, member=user).delete()
-    messages.success(request, f'{user.get_display_name()} has been removed from the team.')
-    
+
+    # One lookup serves the existence check, the display name for the
+    # message, and the row to delete — no separate CustomUser SELECT
+    membership = TeamMembership.objects.select_related('member').filter(
+        team=team, member_id=user_id
+    ).first()
+    if membership is None:
+        messages.error(request, 'That user is not a member of this team.')
+        return redirect('users:manage_members', pk=team.pk)
+
+    member_name = membership.member.get_display_name()
+    membership.delete()
+    messages.success(request, f'{member_name} has been removed from the team.')
+
     return redirect('users:manage_members', pk=team.pk)
 
 
@@ -243,7 +265,7 @@ def leave_team(request, pk):
     team = get_object_or_404(Team, pk=pk)
     
     # Cannot leave if you're the team leader
-    if team.leader == request.user:
+    if team.leader_id == request.user.id:
         messages.error(request, 'Team leaders cannot leave their own team.')
         return redirect('users:team_detail', pk=team.pk)
     
@@ -38,6 +38,7 @@ urlpatterns = [
     path('dashboard/', task_views.dashboard_redirect, name='dashboard'),
     path('dashboard/leader/', task_views.leader_dashboard, name='dashboard_leader'),
     path('dashboard/member/', task_views.member_dashboard, name='dashboard_member'),
+    path('api/calendar-events/', task_views.calendar_events, name='calendar_events'),
 
     # Team management
     path('teams/', team_views.team_list, name='team_list'),
@@ -3,6 +3,8 @@ Views for user authentication and profile management.
 """
 import logging
 
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
@@ -10,7 +12,7 @@ from django.contrib.auth.views import PasswordResetView, PasswordResetConfirmVie
 from django.contrib import messages
 from django.views.decorators.http import require_http_methods
 from django.urls import reverse_lazy
-from .models import CustomUser, Team, TeamMembership, Task
+from .models import CustomUser, Team, Task
 
 logger = logging.getLogger(__name__)
 from .forms import (
@@ -21,43 +23,76 @@ from .forms import (
 )
 
 
+# Home page counters are kept current by incr/decr signal handlers in
+# signals.py, so the TTL only bounds drift from edge cases the handlers
+# cannot see (e.g. a whole team being deactivated): expiry forces a
+# recompute once an hour.
+HOME_STATS_TTL = 3600
+
+
+def home_team_count_key(user_id):
+    """Cache key for a user's home page team counter."""
+    return f'home:team_count:{user_id}'
+
+
+def home_active_tasks_key(user_id):
+    """Cache key for a user's home page active-task counter."""
+    return f'home:active_tasks:{user_id}'
+
+
+def _compute_team_count(user):
+    """
+    Count the teams shown on the home page for ``user``.
+    """
+    try:
+        # One COUNT regardless of role: accessible_to covers the
+        # led-teams/member-teams union without double counting, so the
+        # leader branch no longer needs two counts and an exclude()
+        teams = Team.objects.filter(is_active=True)
+        if not user.is_admin():
+            teams = teams.accessible_to(user)
+        return teams.count()
+    except Exception:
+        return 0
+
+
+def _compute_active_tasks_count(user):
+    """
+    Count the user's open assigned tasks for the home page.
+    """
+    try:
+        return Task.objects.filter(
+            assigned_to=user,
+            status__in=Task.ACTIVE_STATUSES,
+            team__is_active=True
+        ).count()
+    except Exception:
+        return 0
+
+
 def home(request):
     """
     Home page view with user statistics.
+
+    The counters live in the cache and are adjusted on writes, so a
+    typical load renders with zero count queries; a cache miss falls
+    back to recomputing from the database.
     """
     context = {}
-    
+
     if request.user.is_authenticated:
-        try:
-            # Calculate team count based on user role
-            if request.user.is_admin():
-                team_count = Team.objects.filter(is_active=True).count()
-            elif request.user.is_team_leader():
-                led_teams = Team.objects.filter(leader=request.user, is_active=True).count()
-                member_teams = TeamMembership.objects.filter(
-                    member=request.user,
-                    team__is_active=True
-                ).exclude(team__leader=request.user).count()
-                team_count = led_teams + member_teams
-            else:
-                team_count = TeamMembership.objects.filter(
-                    member=request.user,
-                    team__is_active=True
-                ).count()
-            context['user_team_count'] = team_count
-        except Exception:
-            context['user_team_count'] = 0
-
-        try:
-            active_tasks_count = Task.objects.filter(
-                assigned_to=request.user,
-                status__in=['not_started', 'in_progress', 'review'],
-                team__is_active=True
-            ).count()
-            context['active_tasks_count'] = active_tasks_count
-        except Exception:
-            context['active_tasks_count'] = 0
-    
+        user = request.user
+        context['user_team_count'] = cache.get_or_set(
+            home_team_count_key(user.pk),
+            lambda: _compute_team_count(user),
+            HOME_STATS_TTL,
+        )
+        context['active_tasks_count'] = cache.get_or_set(
+            home_active_tasks_key(user.pk),
+            lambda: _compute_active_tasks_count(user),
+            HOME_STATS_TTL,
+        )
+
     return render(request, 'home.html', context)
 
 
@@ -217,9 +252,18 @@ def user_list(request):
         messages.error(request, 'You do not have permission to access this page.')
         return redirect('home')
     
-    users = CustomUser.objects.all().order_by('-date_joined')
-    
+    # Paginated and restricted to the columns the table renders, so the
+    # page stays bounded however large the user table grows
+    users_qs = CustomUser.objects.only(
+        'username', 'first_name', 'last_name', 'email', 'role',
+        'is_active', 'date_joined', 'profile_picture',
+    ).order_by('-date_joined')
+
+    paginator = Paginator(users_qs, 50)
+    page_obj = paginator.get_page(request.GET.get('page'))
+
     context = {
-        'users': users,
+        'users': page_obj,
+        'page_obj': page_obj,
     }
     return render(request, 'users/user_list.html', context)